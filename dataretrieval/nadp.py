@@ -35,7 +35,7 @@ import re
 import zipfile
 from os.path import basename
 
-import requests
+from dataretrieval.utils import _SESSION
 
 NADP_URL = "https://nadp.slh.wisc.edu"
 NADP_MAP_EXT = "filelib/maps"
@@ -58,6 +58,8 @@ NTN_DEP_PARAMS = [
 
 NTN_MEAS_TYPE = ["conc", "dep", "precip"]  # concentration or deposition
 
+_TIF_RE = re.compile(".*tif$")
+
 
 class NADP_ZipFile(zipfile.ZipFile):
     """Extend zipfile.ZipFile for working on data from NADP"""
@@ -65,8 +67,7 @@ class NADP_ZipFile(zipfile.ZipFile):
     def tif_name(self):
         """Get the name of the tif file in the zip file."""
         filenames = self.namelist()
-        r = re.compile(".*tif$")
-        tif_list = list(filter(r.match, filenames))
+        tif_list = list(filter(_TIF_RE.match, filenames))
         return tif_list[0]
 
     def tif(self):
@@ -197,7 +198,7 @@ def get_zip(url, filename):
         finish docstring
 
     """
-    req = requests.get(url + filename)
+    req = _SESSION.get(url + filename)
     req.raise_for_status()
 
     # z = zipfile.ZipFile(io.BytesIO(req.content))
@@ -1,7 +1,8 @@
+from functools import lru_cache
 from json import JSONDecodeError
 from typing import Literal, Optional, Union
 
-from dataretrieval.utils import query
+from dataretrieval.utils import _decode_json, query
 
 try:
     import geopandas as gpd
@@ -9,7 +10,6 @@ except ImportError:
     raise ImportError("Install geopandas to use the NLDI module.")
 
 NLDI_API_BASE_URL = "https://api.water.usgs.gov/nldi/linked-data"
-_AVAILABLE_DATA_SOURCES = None
 _CRS = "EPSG:4326"
 
 
@@ -21,7 +21,7 @@ def _query_nldi(url, query_params, error_message):
 
     response_data = {}
     try:
-        response_data = response.json()
+        response_data = _decode_json(response)
     except JSONDecodeError:
         # even with a 200 status code, the response sometimes does not return JSON
         # data which causes a JSONDecodeError
@@ -258,7 +258,8 @@ def get_features(
         if data_source:
             _validate_data_source(data_source)
         # validate feature source
-        _validate_data_source(feature_source)
+        if feature_source:
+            _validate_data_source(feature_source)
         # validate the navigation mode
         if navigation_mode:
             _validate_navigation_mode(navigation_mode)
@@ -462,24 +463,26 @@ def search(
     )
 
 
-def _validate_data_source(data_source: str):
-    # A helper function to validate user specified data source/feature source
+@lru_cache(maxsize=None)
+def _get_available_data_sources() -> tuple:
+    # A helper function to get the available data/feature sources - the list
+    # rarely changes, so it is only requested once per session
+    url = f"{NLDI_API_BASE_URL}/"
+    available_data_sources = _query_nldi(
+        url, {}, "Error getting available data sources"
+    )
+    return tuple(ds["source"] for ds in available_data_sources)
 
-    global _AVAILABLE_DATA_SOURCES
 
-    # get the available data/feature sources - if not already cached
-    if _AVAILABLE_DATA_SOURCES is None:
-        url = f"{NLDI_API_BASE_URL}/"
-        available_data_sources = _query_nldi(
-            url, {}, "Error getting available data sources"
+def _validate_data_source(data_source: str):
+    # A helper function to validate user specified data source/feature source
+    available_data_sources = _get_available_data_sources()
+    if data_source not in available_data_sources:
+        err_msg = (
+            f"Invalid data source '{data_source}'."
+            f" Available data sources are: {list(available_data_sources)}"
         )
-        _AVAILABLE_DATA_SOURCES = [ds["source"] for ds in available_data_sources]
-        if data_source not in _AVAILABLE_DATA_SOURCES:
-            err_msg = (
-                f"Invalid data source '{data_source}'."
-                f" Available data sources are: {_AVAILABLE_DATA_SOURCES}"
-            )
-            raise ValueError(err_msg)
+        raise ValueError(err_msg)
 
 
 def _validate_navigation_mode(navigation_mode: str):
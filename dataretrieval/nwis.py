@@ -11,7 +11,6 @@
 
 """
 
-import re
 import warnings
 from io import StringIO
 from typing import List, Optional, Tuple, Union
@@ -21,7 +20,7 @@ import requests
 
 from dataretrieval.utils import BaseMetadata, format_datetime, to_str
 
-from .utils import query
+from .utils import _decode_json, query
 
 try:
     import geopandas as gpd
@@ -34,16 +33,18 @@ WATERSERVICE_URL = "https://waterservices.usgs.gov/nwis/"
 PARAMCODES_URL = "https://help.waterdata.usgs.gov/code/parameter_cd_nm_query?"
 ALLPARAMCODES_URL = "https://help.waterdata.usgs.gov/code/parameter_cd_query?"
 
-WATERSERVICES_SERVICES = ["dv", "iv", "site", "stat"]
-WATERDATA_SERVICES = [
-    "qwdata",
-    "gwlevels",
-    "measurements",
-    "peaks",
-    "pmcodes",
-    "water_use",
-    "ratings",
-]
+WATERSERVICES_SERVICES = frozenset({"dv", "iv", "site", "stat"})
+WATERDATA_SERVICES = frozenset(
+    {
+        "qwdata",
+        "gwlevels",
+        "measurements",
+        "peaks",
+        "pmcodes",
+        "water_use",
+        "ratings",
+    }
+)
 # NAD83
 _CRS = "EPSG:4269"
 
@@ -699,7 +700,7 @@ def get_dv(
     kwargs["multi_index"] = multi_index
 
     response = query_waterservices("dv", format="json", ssl_check=ssl_check, **kwargs)
-    df = _read_json(response.json())
+    df = _read_json(_decode_json(response))
 
     return format_response(df, **kwargs), NWIS_Metadata(response, **kwargs)
 
@@ -884,7 +885,7 @@ def get_iv(
         service="iv", format="json", ssl_check=ssl_check, **kwargs
     )
 
-    df = _read_json(response.json())
+    df = _read_json(_decode_json(response))
     return format_response(df, **kwargs), NWIS_Metadata(response, **kwargs)
 
 
@@ -1255,7 +1256,7 @@ def get_record(
     """
     _check_sites_value_types(sites)
 
-    if service not in WATERSERVICES_SERVICES + WATERDATA_SERVICES:
+    if service not in WATERSERVICES_SERVICES and service not in WATERDATA_SERVICES:
         raise TypeError(f"Unrecognized service: {service}")
 
     if service == "iv":
@@ -1362,7 +1363,8 @@ def _read_json(json):
         A custom metadata object
 
     """
-    merged_df = pd.DataFrame(columns=["site_no", "datetime"])
+    # collect one frame per site and concatenate once at the end
+    site_dfs = [pd.DataFrame(columns=["site_no", "datetime"])]
 
     site_list = [
         ts["sourceInfo"]["siteCode"][0]["value"] for ts in json["value"]["timeSeries"]
@@ -1413,21 +1415,18 @@ def _read_json(json):
                 if not record_json:
                     # no data in record
                     continue
-                # should be able to avoid this by dumping
-                record_json = str(record_json).replace("'", '"')
 
-                # read json, converting all values to float64 and all qualifiers
+                # build the frame from the already-decoded records, converting
+                # all values to float64 and joining the qualifier lists into strings
                 # Lists can't be hashed, thus we cannot df.merge on a list column
-                record_df = pd.read_json(
-                    StringIO(record_json),
-                    orient="records",
-                    dtype={"value": "float64", "qualifiers": "unicode"},
-                    convert_dates=False,
-                )
+                record_df = pd.DataFrame.from_records(record_json)
+                try:
+                    record_df["value"] = record_df["value"].astype("float64")
+                except (TypeError, ValueError):
+                    # leave non-numeric values as they are
+                    pass
 
-                record_df["qualifiers"] = (
-                    record_df["qualifiers"].str.strip("[]").str.replace("'", "")
-                )
+                record_df["qualifiers"] = record_df["qualifiers"].str.join(", ")
 
                 record_df.rename(
                     columns={
@@ -1442,11 +1441,15 @@ def _read_json(json):
 
         # end of site loop
         site_df["site_no"] = site_no
-        merged_df = pd.concat([merged_df, site_df])
+        site_dfs.append(site_df)
+
+    merged_df = pd.concat(site_dfs)
 
     # convert to datetime, normalizing the timezone to UTC when doing so
     if "datetime" in merged_df.columns:
-        merged_df["datetime"] = pd.to_datetime(merged_df["datetime"], utc=True)
+        merged_df["datetime"] = pd.to_datetime(
+            merged_df["datetime"], format="ISO8601", utc=True
+        )
 
     return merged_df
 
@@ -1467,8 +1470,9 @@ def _read_rdb(rdb):
 
     """
     count = 0
+    lines = rdb.splitlines()
 
-    for line in rdb.splitlines():
+    for line in lines:
         # ignore comment lines
         if line.startswith("#"):
             count = count + 1
@@ -1476,7 +1480,7 @@ def _read_rdb(rdb):
         else:
             break
 
-    fields = re.split("[\t]", rdb.splitlines()[count])
+    fields = lines[count].split("\t")
     fields = [field.replace(",", "") for field in fields]
     dtypes = {
         "site_no": str,
@@ -1548,8 +1552,10 @@ class NWIS_Metadata(BaseMetadata):
 
         comments = ""
         for line in response.text.splitlines():
-            if line.startswith("#"):
-                comments += line.lstrip("#") + "\n"
+            # comments only appear in the header, so stop at the first data line
+            if not line.startswith("#"):
+                break
+            comments += line.lstrip("#") + "\n"
         if comments:
             self.comment = comments
 
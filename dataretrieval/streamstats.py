@@ -7,7 +7,7 @@ This module is a wrapper for the streamstats API (`streamstats documentation`_).
 
 import json
 
-import requests
+from dataretrieval.utils import _SESSION
 
 
 def download_workspace(workspaceID, format=""):
@@ -32,7 +32,7 @@ def download_workspace(workspaceID, format=""):
     payload = {"workspaceID": workspaceID, "format": format}
     url = "https://streamstats.usgs.gov/streamstatsservices/download"
 
-    r = requests.get(url, params=payload)
+    r = _SESSION.get(url, params=payload)
 
     r.raise_for_status()
     return r
@@ -125,7 +125,7 @@ def get_watershed(
     }
     url = "https://streamstats.usgs.gov/streamstatsservices/watershed.geojson"
 
-    r = requests.get(url, params=payload)
+    r = _SESSION.get(url, params=payload)
 
     r.raise_for_status()
 
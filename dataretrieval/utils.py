@@ -6,10 +6,36 @@ import warnings
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import dataretrieval
 from dataretrieval.codes import tz
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# shared session so repeated queries reuse pooled connections; transient server
+# errors are retried, and the last response is returned for ``query`` to handle
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        ),
+    ),
+)
+# identify the package in every request; set once rather than per query
+_SESSION.headers["user-agent"] = f"python-dataretrieval/{dataretrieval.__version__}"
+
 
 def to_str(listlike, delimiter=","):
     """Translates list-like objects into strings.
@@ -184,10 +210,7 @@ def query(url, payload, delimiter=",", ssl_check=True):
     #    key, value = payload[index]
     #    payload[index] = (key, to_str(value))
 
-    # define the user agent for the query
-    user_agent = {"user-agent": f"python-dataretrieval/{dataretrieval.__version__}"}
-
-    response = requests.get(url, params=payload, headers=user_agent, verify=ssl_check)
+    response = _SESSION.get(url, params=payload, verify=ssl_check)
 
     if response.status_code == 400:
         raise ValueError(
@@ -215,12 +238,37 @@ def query(url, payload, delimiter=",", ssl_check=True):
             + f"split your query: \n {_example}"
         )
 
-    if response.text.startswith("No sites/data"):
+    # check the raw bytes, so large responses are not decoded just for this test
+    if response.content.startswith(b"No sites/data"):
         raise NoSitesError(response.url)
 
     return response
 
 
+def _decode_json(response):
+    """Decode a JSON response, using ``orjson`` when it is installed.
+
+    Parameters
+    ----------
+    response: ``requests.models.Response``
+        The response from the API query
+
+    Returns
+    -------
+    data: dict
+        The decoded JSON content of the response
+
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # fall back to the standard library, which is more lenient and
+            # raises the error type that callers expect
+            pass
+    return response.json()
+
+
 class NoSitesError(Exception):
     """Custom error class used when selection criteria returns no sites/data."""
 
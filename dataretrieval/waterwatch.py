@@ -1,8 +1,11 @@
+from functools import lru_cache
 from typing import Dict, List, Union
 
 import pandas as pd
 import requests
 
+from .utils import _SESSION, _decode_json
+
 ResponseFormat = "json"  # json, xml
 
 # WaterWatch won't receive any new features but it will continue to operate.
@@ -13,6 +16,20 @@ def _read_json(data: Dict) -> pd.DataFrame:
     return pd.DataFrame(data).T
 
 
+@lru_cache(maxsize=1)
+def _get_flood_stages() -> Dict:
+    # the flood stage table covers every site and rarely changes, so it is
+    # only requested once per session
+    res = _SESSION.get(waterwatch_url + "floodstage", params={"format": ResponseFormat})
+
+    if res.ok:
+        json_res = _decode_json(res)
+        # the decoded sites are not shared, so take the site number out in place
+        return {site.pop("site_no"): site for site in json_res["sites"]}
+    else:
+        raise requests.RequestException(f"[{res.status_code}] - {res.reason}")
+
+
 def get_flood_stage(
     sites: List[str] = None, fmt: str = "DF"
 ) -> Union[pd.DataFrame, Dict]:
@@ -53,28 +70,18 @@ def get_flood_stage(
         50057000           16          20                   24                30
 
     """
-    res = requests.get(waterwatch_url + "floodstage", params={"format": ResponseFormat})
-
-    if res.ok:
-        json_res = res.json()
-        stages = {
-            site["site_no"]: {k: v for k, v in site.items() if k != "site_no"}
-            for site in json_res["sites"]
-        }
-    else:
-        raise requests.RequestException(f"[{res.status_code}] - {res.reason}")
+    stages = _get_flood_stages()
 
     if not sites:
         stations_stages = stages
     else:
-        stations_stages = {}
-        for site in sites:
-            try:
-                stations_stages[site] = stages[site]
-            except KeyError:
-                stations_stages[site] = None
+        stations_stages = {site: stages.get(site) for site in sites}
 
     if fmt == "dict":
-        return stations_stages
+        # copy the stages so callers cannot modify the cached table
+        return {
+            site: None if stage is None else dict(stage)
+            for site, stage in stations_stages.items()
+        }
     else:
         return _read_json(stations_stages)
@@ -12,7 +12,9 @@ See https://waterqualitydata.us/webservices_documentation for API reference
 from __future__ import annotations
 
 import warnings
-from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from io import BytesIO
 from typing import TYPE_CHECKING
 
 import pandas as pd
@@ -22,27 +24,67 @@ from .utils import BaseMetadata, query
 if TYPE_CHECKING:
     from pandas import DataFrame
 
-
-result_profiles_wqx3 = ["basicPhysChem", "fullPhysChem", "narrow"]
-result_profiles_legacy = ["biological", "narrowResult","resultPhysChem"] 
-activity_profiles_legacy = ["activityAll"]
-services_wqx3 = ["Activity", "Result", "Station"]
-services_legacy = [
-    "Activity",
-    "ActivityMetric",
-    "BiologicalMetric",
-    "Organization",
-    "Project",
-    "ProjectMonitoringLocationWeighting",
-    "Result",
-    "ResultDetectionQuantitationLimit",
-    "Station",
+WQP_URL = "https://www.waterqualitydata.us/data/"
+WQX3_URL = "https://www.waterqualitydata.us/wqx3/"
+
+result_profiles_wqx3 = frozenset({"basicPhysChem", "fullPhysChem", "narrow"})
+result_profiles_legacy = frozenset({"biological", "narrowResult", "resultPhysChem"})
+activity_profiles_legacy = frozenset({"activityAll"})
+services_wqx3 = frozenset({"Activity", "Result", "Station"})
+services_legacy = frozenset(
+    {
+        "Activity",
+        "ActivityMetric",
+        "BiologicalMetric",
+        "Organization",
+        "Project",
+        "ProjectMonitoringLocationWeighting",
+        "Result",
+        "ResultDetectionQuantitationLimit",
+        "Station",
+    }
+)
+# date columns, which WQP reports as YYYY-MM-DD, in the legacy and WQX3.0 profiles
+_DATE_COLUMNS = [
+    "ActivityStartDate",
+    "ActivityEndDate",
+    "AnalysisStartDate",
+    "PreparationStartDate",
+    "Activity_StartDate",
+    "Activity_EndDate",
+    "LabInfo_AnalysisStartDate",
+    "LabInfo_AnalysisEndDate",
+    "LabSamplePrepMethod_StartDate",
+    "LabSamplePrepMethod_EndDate",
+]
+# low-cardinality text columns, in the legacy and WQX3.0 profiles
+_CATEGORICAL_COLUMNS = [
+    "OrganizationIdentifier",
+    "OrganizationFormalName",
+    "ActivityTypeCode",
+    "ActivityMediaName",
+    "MonitoringLocationIdentifier",
+    "CharacteristicName",
+    "ResultSampleFractionText",
+    "ResultMeasure/MeasureUnitCode",
+    "ResultStatusIdentifier",
+    "ProviderName",
+    "Org_Identifier",
+    "Org_FormalName",
+    "Activity_TypeCode",
+    "Activity_Media",
+    "Location_Identifier",
+    "Result_Characteristic",
+    "Result_SampleFraction",
+    "Result_MeasureUnit",
+    "Result_MeasureStatusIdentifier",
 ]
 
 
 def get_results(
     ssl_check=True,
     legacy=True,
+    categorical=False,
     **kwargs,
 ) -> tuple[DataFrame, WQP_Metadata]:
     """Query the WQP for results.
@@ -61,6 +103,10 @@ def get_results(
         Check the SSL certificate.
     legacy : bool, optional
         Return the legacy WQX data profile. Default is True.
+    categorical : bool, optional
+        If True, return repetitive text columns such as the organization,
+        site, characteristic name and unit as ``category`` dtype, which uses
+        much less memory for large results. Default is False.
     dataProfile : string, optional
         Specifies the data fields returned by the query.
         WQX3.0 profiles include 'fullPhysChem', 'narrow', and 'basicPhysChem'.
@@ -97,6 +143,9 @@ def get_results(
         semicolons (https://www.waterqualitydata.us/public_srsnames/).
     mimeType : string
         Output format. Only 'csv' is supported at this time.
+    zip : string
+        If 'yes', the CSV is downloaded as a zip archive, which can greatly
+        reduce transfer time for large queries. Default is 'no'.
 
     Returns
     -------
@@ -124,34 +173,30 @@ def get_results(
 
     """
 
-    kwargs = _check_kwargs(kwargs)
-
     if legacy is True:
         if "dataProfile" in kwargs:
             if kwargs["dataProfile"] not in result_profiles_legacy:
                 raise TypeError(
                     f"dataProfile {kwargs['dataProfile']} is not a legacy profile.",
-                    f"Valid options are {result_profiles_legacy}.",
+                    f"Valid options are {sorted(result_profiles_legacy)}.",
                 )
 
-        url = wqp_url("Result")
-
     else:
         if "dataProfile" in kwargs:
             if kwargs["dataProfile"] not in result_profiles_wqx3:
                 raise TypeError(
                     f"dataProfile {kwargs['dataProfile']} is not a valid WQX3.0"
-                    f"profile. Valid options are {result_profiles_wqx3}.",
+                    f"profile. Valid options are {sorted(result_profiles_wqx3)}.",
                 )
-        else:
-            kwargs["dataProfile"] = "fullPhysChem"
 
-        url = wqx3_url("Result")
-
-    response = query(url, kwargs, delimiter=";", ssl_check=ssl_check)
-
-    df = pd.read_csv(StringIO(response.text), delimiter=",")
-    return df, WQP_Metadata(response)
+    return _query_service(
+        "Result",
+        kwargs,
+        legacy=legacy,
+        ssl_check=ssl_check,
+        categorical=categorical,
+        default_profile=None if legacy else "fullPhysChem",
+    )
 
 
 def what_sites(
@@ -198,18 +243,7 @@ def what_sites(
 
     """
 
-    kwargs = _check_kwargs(kwargs)
-
-    if legacy is True:
-        url = wqp_url("Station")
-    else:
-        url = wqx3_url("Station")
-
-    response = query(url, payload=kwargs, delimiter=";", ssl_check=ssl_check)
-
-    df = pd.read_csv(StringIO(response.text), delimiter=",")
-
-    return df, WQP_Metadata(response)
+    return _query_service("Station", kwargs, legacy=legacy, ssl_check=ssl_check)
 
 
 def what_organizations(
@@ -252,19 +286,7 @@ def what_organizations(
 
     """
 
-    kwargs = _check_kwargs(kwargs)
-
-    if legacy is True:
-        url = wqp_url("Organization")
-    else:
-        print("WQX3.0 profile not available, returning legacy profile.")
-        url = wqp_url("Organization")
-
-    response = query(url, payload=kwargs, delimiter=";", ssl_check=ssl_check)
-
-    df = pd.read_csv(StringIO(response.text), delimiter=",")
-
-    return df, WQP_Metadata(response)
+    return _query_service("Organization", kwargs, legacy=legacy, ssl_check=ssl_check)
 
 
 def what_projects(ssl_check=True, legacy=True, **kwargs):
@@ -303,24 +325,13 @@ def what_projects(ssl_check=True, legacy=True, **kwargs):
 
     """
 
-    kwargs = _check_kwargs(kwargs)
-
-    if legacy is True:
-        url = wqp_url("Project")
-    else:
-        print("WQX3.0 profile not available, returning legacy profile.")
-        url = wqp_url("Project")
-
-    response = query(url, payload=kwargs, delimiter=";", ssl_check=ssl_check)
-
-    df = pd.read_csv(StringIO(response.text), delimiter=",")
-
-    return df, WQP_Metadata(response)
+    return _query_service("Project", kwargs, legacy=legacy, ssl_check=ssl_check)
 
 
 def what_activities(
     ssl_check=True,
     legacy=True,
+    categorical=False,
     **kwargs,
 ) -> tuple[DataFrame, WQP_Metadata]:
     """Search WQP for activities within a region with specific data.
@@ -339,6 +350,10 @@ def what_activities(
         Check the SSL certificate. Default is True.
     legacy : bool, optional
         Return the legacy WQX data profile. Default is True.
+    categorical : bool, optional
+        If True, return repetitive text columns such as the organization and
+        site as ``category`` dtype, see :obj:`dataretrieval.wqp.get_results`.
+        Default is False.
     **kwargs : optional
         Accepts the same parameters as :obj:`dataretrieval.wqp.get_results`
 
@@ -371,23 +386,19 @@ def what_activities(
         ... )
     """
 
-    kwargs = _check_kwargs(kwargs)
-
-    if legacy is True:
-        url = wqp_url("Activity")
-    else:
-        url = wqx3_url("Activity")
-
-    response = query(url, payload=kwargs, delimiter=";", ssl_check=ssl_check)
-
-    df = pd.read_csv(StringIO(response.text), delimiter=",")
-
-    return df, WQP_Metadata(response)
+    return _query_service(
+        "Activity",
+        kwargs,
+        legacy=legacy,
+        ssl_check=ssl_check,
+        categorical=categorical,
+    )
 
 
 def what_detection_limits(
     ssl_check=True,
     legacy=True,
+    categorical=False,
     **kwargs,
 ) -> tuple[DataFrame, WQP_Metadata]:
     """Search WQP for result detection limits within a region with specific
@@ -407,6 +418,10 @@ def what_detection_limits(
         Check the SSL certificate. Default is True.
     legacy : bool
         Return the legacy WQX data profile. Default is True.
+    categorical : bool, optional
+        If True, return repetitive text columns such as the organization and
+        site as ``category`` dtype, see :obj:`dataretrieval.wqp.get_results`.
+        Default is False.
     **kwargs : optional
         Accepts the same parameters as :obj:`dataretrieval.wqp.get_results`
 
@@ -432,19 +447,13 @@ def what_detection_limits(
 
     """
 
-    kwargs = _check_kwargs(kwargs)
-
-    if legacy is True:
-        url = wqp_url("ResultDetectionQuantitationLimit")
-    else:
-        print("WQX3.0 profile not available, returning legacy profile.")
-        url = wqp_url("ResultDetectionQuantitationLimit")
-
-    response = query(url, payload=kwargs, delimiter=";", ssl_check=ssl_check)
-
-    df = pd.read_csv(StringIO(response.text), delimiter=",")
-
-    return df, WQP_Metadata(response)
+    return _query_service(
+        "ResultDetectionQuantitationLimit",
+        kwargs,
+        legacy=legacy,
+        ssl_check=ssl_check,
+        categorical=categorical,
+    )
 
 
 def what_habitat_metrics(
@@ -487,19 +496,9 @@ def what_habitat_metrics(
 
     """
 
-    kwargs = _check_kwargs(kwargs)
-
-    if legacy is True:
-        url = wqp_url("BiologicalMetric")
-    else:
-        print("WQX3.0 profile not available, returning legacy profile.")
-        url = wqp_url("BiologicalMetric")
-
-    response = query(url, payload=kwargs, delimiter=";", ssl_check=ssl_check)
-
-    df = pd.read_csv(StringIO(response.text), delimiter=",")
-
-    return df, WQP_Metadata(response)
+    return _query_service(
+        "BiologicalMetric", kwargs, legacy=legacy, ssl_check=ssl_check
+    )
 
 
 def what_project_weights(ssl_check=True, legacy=True, **kwargs):
@@ -543,19 +542,9 @@ def what_project_weights(ssl_check=True, legacy=True, **kwargs):
 
     """
 
-    kwargs = _check_kwargs(kwargs)
-
-    if legacy is True:
-        url = wqp_url("ProjectMonitoringLocationWeighting")
-    else:
-        print("WQX3.0 profile not available, returning legacy profile.")
-        url = wqp_url("ProjectMonitoringLocationWeighting")
-
-    response = query(url, payload=kwargs, delimiter=";", ssl_check=ssl_check)
-
-    df = pd.read_csv(StringIO(response.text), delimiter=",")
-
-    return df, WQP_Metadata(response)
+    return _query_service(
+        "ProjectMonitoringLocationWeighting", kwargs, legacy=legacy, ssl_check=ssl_check
+    )
 
 
 def what_activity_metrics(ssl_check=True, legacy=True, **kwargs):
@@ -599,49 +588,199 @@ def what_activity_metrics(ssl_check=True, legacy=True, **kwargs):
 
     """
 
-    kwargs = _check_kwargs(kwargs)
+    return _query_service("ActivityMetric", kwargs, legacy=legacy, ssl_check=ssl_check)
 
-    if legacy is True:
-        url = wqp_url("ActivityMetric")
-    else:
-        print("WQX3.0 profile not available, returning legacy profile.")
-        url = wqp_url("ActivityMetric")
 
-    response = query(url, payload=kwargs, delimiter=";", ssl_check=ssl_check)
+def get_results_many(
+    siteids,
+    chunksize=50,
+    ssl_check=True,
+    legacy=True,
+    **kwargs,
+) -> tuple[DataFrame, list[WQP_Metadata]]:
+    """Query the WQP for results from many sites, a batch of sites at a time.
+
+    Rather than calling :obj:`dataretrieval.wqp.get_results` once per site,
+    the sites are sent ``chunksize`` at a time as a single semicolon-delimited
+    ``siteid``, which greatly reduces the number of requests.
+
+    Parameters
+    ----------
+    siteids : string or list of strings
+        WQP site identifiers, e.g. 'USGS-01646500'.
+    chunksize : int, optional
+        Number of sites to request per query. Default is 50.
+    ssl_check : bool, optional
+        Check the SSL certificate. Default is True.
+    legacy : bool, optional
+        Return the legacy WQX data profile. Default is True.
+    **kwargs : optional
+        Accepts the same parameters as :obj:`dataretrieval.wqp.get_results`
+
+    Returns
+    -------
+    df : ``pandas.DataFrame``
+        Formatted data returned from all of the queries.
+    md : list of :obj:`dataretrieval.wqp.WQP_Metadata`
+        Custom metadata object for each query.
+
+    Examples
+    --------
+    .. code::
+
+        >>> # Get chloride results for several sites
+        >>> df, md = dataretrieval.wqp.get_results_many(
+        ...     ["USGS-05427718", "USGS-05427850", "USGS-05427930"],
+        ...     characteristicName="Chloride",
+        ... )
 
-    df = pd.read_csv(StringIO(response.text), delimiter=",")
+    """
+    if isinstance(siteids, str):
+        siteids = [siteids]
+    siteids = list(siteids)
+    if not siteids:
+        raise ValueError("At least one siteid must be provided.")
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}.")
+    # each batch would get its own categories, which concat falls back to
+    # object for, so convert once the batches are combined
+    categorical = kwargs.pop("categorical", False)
+
+    dfs = []
+    mds = []
+    for start in range(0, len(siteids), chunksize):
+        df, md = get_results(
+            ssl_check=ssl_check,
+            legacy=legacy,
+            siteid=siteids[start : start + chunksize],
+            **kwargs,
+        )
+        dfs.append(df)
+        mds.append(md)
+
+    df = pd.concat(dfs, ignore_index=True)
+    if categorical:
+        df = _to_categorical(df)
+    return df, mds
+
+
+# public function for each WQP service, used by get_bundle
+_SERVICE_FUNCTIONS = {
+    "Result": get_results,
+    "Station": what_sites,
+    "Organization": what_organizations,
+    "Project": what_projects,
+    "Activity": what_activities,
+    "ResultDetectionQuantitationLimit": what_detection_limits,
+    "BiologicalMetric": what_habitat_metrics,
+    "ProjectMonitoringLocationWeighting": what_project_weights,
+    "ActivityMetric": what_activity_metrics,
+}
+# keywords that only the functions for some services accept
+_SERVICE_KEYWORDS = {
+    "dataProfile": frozenset({"Result"}),
+    "categorical": frozenset(
+        {"Result", "Activity", "ResultDetectionQuantitationLimit"}
+    ),
+}
+
+
+def get_bundle(
+    services=("Result", "Station", "Activity"),
+    ssl_check=True,
+    legacy=True,
+    **kwargs,
+) -> dict[str, tuple[DataFrame, WQP_Metadata]]:
+    """Query several WQP services for the same region or sites at once.
 
-    return df, WQP_Metadata(response)
+    Each service is queried in its own thread, so the total wait is that of
+    the slowest query rather than the sum of all of them. The threads share
+    the module's ``requests`` session, :obj:`dataretrieval.utils._SESSION`.
+
+    Parameters
+    ----------
+    services : list of strings, optional
+        WQP services to query, e.g. 'Result', 'Station' or 'Activity'.
+        Default is ('Result', 'Station', 'Activity').
+    ssl_check : bool, optional
+        Check the SSL certificate. Default is True.
+    legacy : bool, optional
+        Return the legacy WQX data profile. Default is True.
+    **kwargs : optional
+        Accepts the same parameters as :obj:`dataretrieval.wqp.get_results`,
+        which are passed to every service. Keywords that only some services
+        support, ``dataProfile`` and ``categorical``, raise a ValueError if
+        any other service is requested.
+
+    Returns
+    -------
+    bundle : dict
+        The ``(df, md)`` tuple returned for each service, keyed by service.
+
+    Examples
+    --------
+    .. code::
+
+        >>> # Get results, sites and activities for a site in one call
+        >>> bundle = dataretrieval.wqp.get_bundle(siteid="WIDNR_WQX-10032762")
+        >>> df, md = bundle["Result"]
+
+    """
+    for service in services:
+        if service not in _SERVICE_FUNCTIONS:
+            raise TypeError(
+                f"Service {service} not recognized. "
+                f"Valid options are {sorted(_SERVICE_FUNCTIONS)}."
+            )
+    for keyword, supported in _SERVICE_KEYWORDS.items():
+        unsupported = sorted(set(services) - supported)
+        if keyword in kwargs and unsupported:
+            raise ValueError(
+                f"{keyword} is not supported by the {unsupported} services. "
+                "Query those services separately."
+            )
+
+    # queries are network bound, so threads let them wait on WQP concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(services) or 1)) as executor:
+        # unpacking kwargs gives each query its own payload, which query() modifies
+        futures = {
+            service: executor.submit(
+                _SERVICE_FUNCTIONS[service],
+                ssl_check=ssl_check,
+                legacy=legacy,
+                **kwargs,
+            )
+            for service in services
+        }
+        return {service: future.result() for service, future in futures.items()}
 
 
 def wqp_url(service):
     """Construct the WQP URL for a given service."""
 
-    base_url = "https://www.waterqualitydata.us/data/"
     _warn_legacy_use()
 
     if service not in services_legacy:
         raise TypeError(
             "Legacy service not recognized. Valid options are",
-            f"{services_legacy}.",
+            f"{sorted(services_legacy)}.",
         )
 
-    return f"{base_url}{service}/Search?"
+    return f"{WQP_URL}{service}/Search?"
 
 
 def wqx3_url(service):
     """Construct the WQP URL for a given WQX 3.0 service."""
 
-    base_url = "https://www.waterqualitydata.us/wqx3/"
     _warn_wqx3_use()
 
     if service not in services_wqx3:
         raise TypeError(
             "WQX3.0 service not recognized. Valid options are",
-            f"{services_wqx3}.",
+            f"{sorted(services_wqx3)}.",
         )
 
-    return f"{base_url}{service}/search?"
+    return f"{WQX3_URL}{service}/search?"
 
 
 class WQP_Metadata(BaseMetadata):
@@ -657,11 +796,12 @@ class WQP_Metadata(BaseMetadata):
         Response headers
     comments : None
         Metadata comments. WQP does not return comments.
-    site_info : tuple[pd.DataFrame, NWIS_Metadata] | None
-        Site information if the query included `sites`, `site` or `site_no`.
+    site_info : tuple[pd.DataFrame, WQP_Metadata] | None
+        Site information if the query included `siteid`, `sites`, `site` or
+        `site_no`.
     """
 
-    def __init__(self, response, **parameters) -> None:
+    def __init__(self, response, legacy=True, ssl_check=True, **parameters) -> None:
         """Generates a standard set of metadata informed by the response with specific
         metadata for WQP data.
 
@@ -670,6 +810,12 @@ class WQP_Metadata(BaseMetadata):
         response : Response
             Response object from requests module
 
+        legacy : bool, optional
+            Whether the query used the legacy WQX data profile. Default is True.
+
+        ssl_check : bool, optional
+            Whether the query checked the SSL certificate. Default is True.
+
         parameters : dict
             Unpacked dictionary of the parameters supplied in the request
 
@@ -683,26 +829,102 @@ class WQP_Metadata(BaseMetadata):
         super().__init__(response)
 
         self._parameters = parameters
+        # look up site information the same way the original query was made
+        self._legacy = legacy
+        self._ssl_check = ssl_check
 
-        @property
-        def site_info(self):
-            if "sites" in self._parameters:
-                return what_sites(sites=parameters["sites"])
-            elif "site" in self._parameters:
-                return what_sites(sites=parameters["site"])
-            elif "site_no" in self._parameters:
-                return what_sites(sites=parameters["site_no"])
+    @cached_property
+    def site_info(self) -> tuple[DataFrame, WQP_Metadata] | None:
+        """
+        Return
+        ------
+        df: ``pandas.DataFrame``
+            Formatted requested data from calling `wqp.what_sites`
+        md: :obj:`dataretrieval.wqp.WQP_Metadata`
+            A WQP_Metadata object
+        """
+        # looked up once on first access, as it requires another WQP query
+        for key in ("siteid", "sites", "site", "site_no"):
+            if key in self._parameters:
+                return what_sites(
+                    ssl_check=self._ssl_check,
+                    legacy=self._legacy,
+                    siteid=self._parameters[key],
+                )
+        return None
+
+
+def _query_service(
+    service,
+    kwargs,
+    legacy=True,
+    ssl_check=True,
+    categorical=False,
+    default_profile=None,
+):
+    """Private function to query a WQP service and read the CSV response."""
+    kwargs = _check_kwargs(kwargs)
+    if default_profile is not None:
+        kwargs.setdefault("dataProfile", default_profile)
+
+    if legacy is True:
+        url = wqp_url(service)
+    elif service in services_wqx3:
+        url = wqx3_url(service)
+    else:
+        _warn_wqx3_unavailable()
+        url = wqp_url(service)
+
+    response = query(url, payload=kwargs, delimiter=";", ssl_check=ssl_check)
+
+    df = _read_csv(response, categorical=categorical)
+    return df, WQP_Metadata(response, legacy=legacy, ssl_check=ssl_check, **kwargs)
+
+
+def _read_csv(response, categorical=False):
+    """Private function to read a WQP CSV response into a DataFrame."""
+    # queries made with zip="yes" return the CSV inside a zip archive
+    content_type = response.headers.get("Content-Type", "")
+    compression = "zip" if content_type.startswith("application/zip") else None
+    # infer dtypes from whole columns; chunked inference yields mixed types
+    df = pd.read_csv(
+        BytesIO(response.content),
+        delimiter=",",
+        engine="c",
+        encoding="utf-8",
+        # replace invalid bytes, e.g. cp1252 characters in legacy records
+        encoding_errors="replace",
+        low_memory=False,
+        compression=compression,
+    )
+    # parse dates with their known format rather than inferring it per value
+    for col in df.columns.intersection(_DATE_COLUMNS):
+        try:
+            df[col] = pd.to_datetime(df[col], format="%Y-%m-%d")
+        except (TypeError, ValueError):
+            # leave columns with any other date format as returned
+            pass
+    if categorical:
+        df = _to_categorical(df)
+    return df
+
+
+def _to_categorical(df):
+    """Private function to convert low-cardinality text columns to categoricals."""
+    for col in df.columns.intersection(_CATEGORICAL_COLUMNS):
+        df[col] = df[col].astype("category")
+    return df
 
 
 def _check_kwargs(kwargs):
     """Private function to check kwargs for unsupported parameters."""
     mimetype = kwargs.get("mimeType")
-    if mimetype == "geojson":
+    if mimetype is None:
+        kwargs["mimeType"] = "csv"
+    elif mimetype == "geojson":
         raise NotImplementedError("GeoJSON not yet supported. Set 'mimeType=csv'.")
-    elif mimetype != "csv" and mimetype is not None:
+    elif mimetype != "csv":
         raise ValueError("Invalid mimeType. Set 'mimeType=csv'.")
-    else:
-        kwargs["mimeType"] = "csv"
 
     return kwargs
 
@@ -715,6 +937,11 @@ def _warn_wqx3_use():
     warnings.warn(message, UserWarning)
 
 
+def _warn_wqx3_unavailable():
+    message = "WQX3.0 profile not available, returning legacy profile."
+    warnings.warn(message, UserWarning)
+
+
 def _warn_legacy_use():
     message = (
         "This function call will return the legacy WQX format, "
@@ -1,7 +1,9 @@
+import pytest
 from geopandas import GeoDataFrame
 
 from dataretrieval.nldi import (
     NLDI_API_BASE_URL,
+    _get_available_data_sources,
     get_basin,
     get_features,
     get_flowlines,
@@ -276,3 +278,14 @@ def test_search_for_features_by_lat_long(requests_mock):
     assert search_results["features"][0]["type"] == "Feature"
     assert search_results["features"][0]["geometry"]["type"] == "LineString"
     assert len(search_results["features"][0]["geometry"]["coordinates"]) == 27
+
+
+def test_invalid_data_source(requests_mock):
+    """Tests that an unknown feature source is rejected on every call"""
+    _get_available_data_sources.cache_clear()
+    mock_request_data_sources(requests_mock)
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Invalid data source 'foo'"):
+            get_basin(feature_source="foo", feature_id="USGS-01031500")
+    # the available data sources are only requested once
+    assert requests_mock.call_count == 1
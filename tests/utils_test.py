@@ -38,6 +38,47 @@ class Test_query:
         assert response.status_code == 200  # GET was successful
         assert "user-agent" in response.request.headers
 
+    def test_shared_session(self, requests_mock):
+        """Test that queries are sent through the shared, pooled session."""
+        url = "https://waterservices.usgs.gov/nwis/dv"
+        requests_mock.get(url, text="ok")
+        with mock.patch.object(
+            utils._SESSION, "get", wraps=utils._SESSION.get
+        ) as session_get:
+            utils.query(url, {"sites": "01646500"})
+            utils.query(url, {"sites": "01646500"})
+        assert session_get.call_count == 2
+        assert requests_mock.last_request.headers["user-agent"].startswith(
+            "python-dataretrieval/"
+        )
+
+
+class Test_decode_json:
+    """Tests of the _decode_json function."""
+
+    def test_decode(self):
+        """Decodes with orjson, without calling ``response.json``."""
+        pytest.importorskip("orjson")
+        response = mock.MagicMock()
+        response.content = b'{"value": [1, 2]}'
+        assert utils._decode_json(response) == {"value": [1, 2]}
+        response.json.assert_not_called()
+
+    def test_decode_without_orjson(self):
+        response = mock.MagicMock()
+        response.content = b'{"value": [1, 2]}'
+        response.json.return_value = {"value": [1, 2]}
+        with mock.patch.object(utils, "orjson", None):
+            assert utils._decode_json(response) == {"value": [1, 2]}
+        response.json.assert_called_once()
+
+    def test_fallback_to_response_json(self):
+        """Non-standard JSON (e.g. NaN) falls back to ``response.json``."""
+        response = mock.MagicMock()
+        response.content = b'{"value": NaN}'
+        response.json.return_value = {"value": float("nan")}
+        assert "value" in utils._decode_json(response)
+
 
 class Test_BaseMetadata:
     """Tests of BaseMetadata"""
@@ -0,0 +1,53 @@
+"""Unit tests for functions in waterwatch.py"""
+
+import pandas as pd
+
+from dataretrieval.waterwatch import _get_flood_stages, get_flood_stage
+
+FLOODSTAGE_URL = "https://waterwatch.usgs.gov/webservices/floodstage?format=json"
+FLOODSTAGE_JSON = {
+    "sites": [
+        {
+            "site_no": "07144100",
+            "action_stage": "20",
+            "flood_stage": "22",
+            "moderate_flood_stage": "25",
+            "major_flood_stage": "26",
+        },
+        {
+            "site_no": "50057000",
+            "action_stage": "16",
+            "flood_stage": "20",
+            "moderate_flood_stage": "24",
+            "major_flood_stage": "30",
+        },
+    ]
+}
+
+
+def test_get_flood_stage(requests_mock):
+    """Tests flood stage lookup for known and unknown sites"""
+    _get_flood_stages.cache_clear()
+    requests_mock.get(FLOODSTAGE_URL, json=FLOODSTAGE_JSON)
+    stages = get_flood_stage(["07144100", "07144101"], fmt="dict")
+    assert stages["07144100"]["flood_stage"] == "22"
+    assert stages["07144101"] is None
+
+    df = get_flood_stage(["07144100", "07144101"])
+    assert isinstance(df, pd.DataFrame)
+    assert list(df.index) == ["07144100", "07144101"]
+
+    # the flood stage table is only downloaded once
+    assert requests_mock.call_count == 1
+
+
+def test_get_flood_stage_copy(requests_mock):
+    """Tests that modifying the returned stages does not affect the cache"""
+    _get_flood_stages.cache_clear()
+    requests_mock.get(FLOODSTAGE_URL, json=FLOODSTAGE_JSON)
+    stages = get_flood_stage(fmt="dict")
+    stages["07144100"]["flood_stage"] = "0"
+    stages.pop("50057000")
+    stages = get_flood_stage(fmt="dict")
+    assert stages["07144100"]["flood_stage"] == "22"
+    assert "50057000" in stages
@@ -1,11 +1,18 @@
 import datetime
+import io
+import warnings
+import zipfile
+from unittest import mock
 
 import pytest
 from pandas import DataFrame
 
 from dataretrieval.wqp import (
     _check_kwargs,
+    _read_csv,
+    get_bundle,
     get_results,
+    get_results_many,
     what_activities,
     what_activity_metrics,
     what_detection_limits,
@@ -34,12 +41,37 @@ def test_get_results(requests_mock):
     )
     assert type(df) is DataFrame
     assert df.size == 315
+    assert df["ActivityStartDate"].dtype == "datetime64[ns]"
     assert md.url == request_url
     assert isinstance(md.query_time, datetime.timedelta)
     assert md.header == {"mock_header": "value"}
     assert md.comment is None
 
 
+def test_read_csv_dates():
+    """Tests that date columns in an unexpected format are left as returned"""
+    response = mock.MagicMock()
+    response.headers = {}
+    response.content = b"ActivityStartDate\n2011-05-09\n2011-05-10"
+    df = _read_csv(response)
+    assert df["ActivityStartDate"].dtype == "datetime64[ns]"
+
+    response.content = b"ActivityStartDate\n2011-05-09\n05/10/2011"
+    df = _read_csv(response)
+    assert df["ActivityStartDate"].tolist() == ["2011-05-09", "05/10/2011"]
+
+
+def test_read_csv_invalid_bytes():
+    """Tests that bytes that are not valid UTF-8 are replaced, not raised"""
+    response = mock.MagicMock()
+    response.headers = {}
+    response.content = (
+        b"OrganizationFormalName,ActivityStartDate\nCaf\xe9 Lab,2011-05-09"
+    )
+    df = _read_csv(response)
+    assert df["OrganizationFormalName"].tolist() == ["Caf\ufffd Lab"]
+
+
 def test_get_results_WQX3(requests_mock):
     """Tests water quality portal results query with new WQX3.0 profile"""
     request_url = (
@@ -59,12 +91,62 @@ def test_get_results_WQX3(requests_mock):
     )
     assert type(df) is DataFrame
     assert df.size == 900
+    assert df["Activity_StartDate"].dtype == "datetime64[ns]"
     assert md.url == request_url
     assert isinstance(md.query_time, datetime.timedelta)
     assert md.header == {"mock_header": "value"}
     assert md.comment is None
 
 
+def test_get_results_categorical(requests_mock):
+    """Tests returning low-cardinality result columns as categoricals"""
+    request_url = (
+        "https://www.waterqualitydata.us/data/Result/Search?siteid=WIDNR_WQX-10032762"
+        "&characteristicName=Specific+conductance&startDateLo=05-01-2011&startDateHi=09-30-2011"
+        "&mimeType=csv"
+    )
+    response_file_path = "data/wqp_results.txt"
+    mock_request(requests_mock, request_url, response_file_path)
+    df, md = get_results(
+        categorical=True,
+        siteid="WIDNR_WQX-10032762",
+        characteristicName="Specific conductance",
+        startDateLo="05-01-2011",
+        startDateHi="09-30-2011",
+    )
+    assert df.size == 315
+    assert df["CharacteristicName"].dtype == "category"
+    assert df["ResultMeasure/MeasureUnitCode"].dtype == "category"
+    assert md.url == request_url
+
+
+def test_get_results_zip(requests_mock):
+    """Tests water quality portal results query returning a zip archive"""
+    request_url = (
+        "https://www.waterqualitydata.us/data/Result/Search?siteid=WIDNR_WQX-10032762"
+        "&characteristicName=Specific+conductance&startDateLo=05-01-2011&startDateHi=09-30-2011"
+        "&zip=yes&mimeType=csv"
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as z:
+        z.write("data/wqp_results.txt", "result.csv")
+    requests_mock.get(
+        request_url,
+        content=buffer.getvalue(),
+        headers={"Content-Type": "application/zip"},
+    )
+    df, md = get_results(
+        siteid="WIDNR_WQX-10032762",
+        characteristicName="Specific conductance",
+        startDateLo="05-01-2011",
+        startDateHi="09-30-2011",
+        zip="yes",
+    )
+    assert type(df) is DataFrame
+    assert df.size == 315
+    assert md.url == request_url
+
+
 def test_what_sites(requests_mock):
     """Tests Water quality portal sites query"""
     request_url = (
@@ -99,6 +181,22 @@ def test_what_organizations(requests_mock):
     assert md.comment is None
 
 
+def test_what_organizations_WQX3(requests_mock):
+    """Tests that requesting an unavailable WQX3.0 profile warns"""
+    request_url = (
+        "https://www.waterqualitydata.us/data/Organization/Search?statecode=US%3A34&characteristicName=Chloride"
+        "&mimeType=csv"
+    )
+    response_file_path = "data/wqp_organizations.txt"
+    mock_request(requests_mock, request_url, response_file_path)
+    with pytest.warns(UserWarning, match="WQX3.0 profile not available"):
+        df, md = what_organizations(
+            legacy=False, statecode="US:34", characteristicName="Chloride"
+        )
+    assert df.size == 576
+    assert md.url == request_url
+
+
 def test_what_projects(requests_mock):
     """Tests Water quality portal projects query"""
     request_url = (
@@ -133,6 +231,23 @@ def test_what_activities(requests_mock):
     assert md.comment is None
 
 
+def test_what_activities_categorical(requests_mock):
+    """Tests returning low-cardinality activity columns as categoricals"""
+    request_url = (
+        "https://www.waterqualitydata.us/data/Activity/Search?statecode=US%3A34&characteristicName=Chloride"
+        "&mimeType=csv"
+    )
+    response_file_path = "data/wqp_activities.txt"
+    mock_request(requests_mock, request_url, response_file_path)
+    df, md = what_activities(
+        categorical=True, statecode="US:34", characteristicName="Chloride"
+    )
+    assert df.size == 5087443
+    assert df["ActivityTypeCode"].dtype == "category"
+    assert df["OrganizationIdentifier"].dtype == "category"
+    assert md.url == request_url
+
+
 def test_what_detection_limits(requests_mock):
     """Tests Water quality portal detection limits query"""
     request_url = (
@@ -150,6 +265,23 @@ def test_what_detection_limits(requests_mock):
     assert md.comment is None
 
 
+def test_what_detection_limits_categorical(requests_mock):
+    """Tests returning low-cardinality detection limit columns as categoricals"""
+    request_url = (
+        "https://www.waterqualitydata.us/data/ResultDetectionQuantitationLimit/Search?statecode=US%3A34&characteristicName=Chloride"
+        "&mimeType=csv"
+    )
+    response_file_path = "data/wqp_detection_limits.txt"
+    mock_request(requests_mock, request_url, response_file_path)
+    df, md = what_detection_limits(
+        categorical=True, statecode="US:34", characteristicName="Chloride"
+    )
+    assert df.size == 98770
+    assert df["CharacteristicName"].dtype == "category"
+    assert df["MonitoringLocationIdentifier"].dtype == "category"
+    assert md.url == request_url
+
+
 def test_what_habitat_metrics(requests_mock):
     """Tests Water quality portal habitat metrics query"""
     request_url = (
@@ -201,6 +333,128 @@ def test_what_activity_metrics(requests_mock):
     assert md.comment is None
 
 
+def test_site_info(requests_mock):
+    """Tests that site information is looked up once from the query siteid"""
+    request_url = (
+        "https://www.waterqualitydata.us/data/Result/Search?siteid=WIDNR_WQX-10032762"
+        "&characteristicName=Specific+conductance&startDateLo=05-01-2011&startDateHi=09-30-2011"
+        "&mimeType=csv"
+    )
+    site_url = (
+        "https://www.waterqualitydata.us/data/Station/Search?siteid=WIDNR_WQX-10032762"
+        "&mimeType=csv"
+    )
+    mock_request(requests_mock, request_url, "data/wqp_results.txt")
+    mock_request(requests_mock, site_url, "data/wqp_sites.txt")
+    _, md = get_results(
+        siteid="WIDNR_WQX-10032762",
+        characteristicName="Specific conductance",
+        startDateLo="05-01-2011",
+        startDateHi="09-30-2011",
+    )
+    site_df, site_md = md.site_info
+    assert site_md.url == site_url
+    assert md.site_info[0] is site_df
+    assert requests_mock.call_count == 2
+
+    organization_url = (
+        "https://www.waterqualitydata.us/data/Organization/Search?statecode=US%3A34"
+        "&mimeType=csv"
+    )
+    mock_request(requests_mock, organization_url, "data/wqp_organizations.txt")
+    _, md = what_organizations(statecode="US:34")
+    assert md.site_info is None
+
+    # sites are looked up with the same profile as the original query
+    wqx3_request_url = (
+        "https://www.waterqualitydata.us/wqx3/Result/search?siteid=WIDNR_WQX-10032762"
+        "&mimeType=csv"
+        "&dataProfile=fullPhysChem"
+    )
+    wqx3_site_url = (
+        "https://www.waterqualitydata.us/wqx3/Station/search?siteid=WIDNR_WQX-10032762"
+        "&mimeType=csv"
+    )
+    mock_request(requests_mock, wqx3_request_url, "data/wqp3_results.txt")
+    mock_request(requests_mock, wqx3_site_url, "data/wqp_sites.txt")
+    _, md = get_results(legacy=False, ssl_check=False, siteid="WIDNR_WQX-10032762")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        site_df, site_md = md.site_info
+    assert site_md.url == wqx3_site_url
+    assert requests_mock.last_request.verify is False
+
+
+def test_get_results_many(requests_mock):
+    """Tests that results for many sites are requested in batches"""
+    request_url = "https://www.waterqualitydata.us/data/Result/Search"
+    mock_request(requests_mock, request_url, "data/wqp_results.txt")
+    siteids = [f"WIDNR_WQX-{i}" for i in range(5)]
+    df, mds = get_results_many(siteids, chunksize=2, characteristicName="Chloride")
+    assert requests_mock.call_count == 3
+    assert len(mds) == 3
+    assert df.size == 3 * 315
+    assert requests_mock.request_history[0].qs["siteid"] == ["widnr_wqx-0;widnr_wqx-1"]
+    assert requests_mock.request_history[2].qs["siteid"] == ["widnr_wqx-4"]
+    with pytest.raises(ValueError):
+        get_results_many([])
+    with pytest.raises(ValueError, match="chunksize"):
+        get_results_many(siteids, chunksize=0)
+    with pytest.raises(ValueError, match="chunksize"):
+        get_results_many(siteids, chunksize=-1)
+
+    # a single site given as a string is not split into characters
+    df, mds = get_results_many("WIDNR_WQX-10032762")
+    assert len(mds) == 1
+    assert requests_mock.last_request.qs["siteid"] == ["widnr_wqx-10032762"]
+
+    # categories are set once across all batches, not per batch
+    requests_mock.get(
+        request_url + "?siteid=widnr_wqx-0",
+        content=b"MonitoringLocationIdentifier\nWIDNR_WQX-0",
+        complete_qs=False,
+    )
+    requests_mock.get(
+        request_url + "?siteid=widnr_wqx-1",
+        content=b"MonitoringLocationIdentifier\nWIDNR_WQX-1",
+        complete_qs=False,
+    )
+    df, mds = get_results_many(siteids[:2], chunksize=1, categorical=True)
+    assert len(mds) == 2
+    assert df["MonitoringLocationIdentifier"].dtype == "category"
+    assert df["MonitoringLocationIdentifier"].tolist() == siteids[:2]
+
+
+def test_get_bundle(requests_mock):
+    """Tests querying several WQP services concurrently"""
+    site_url = (
+        "https://www.waterqualitydata.us/data/Station/Search?statecode=US%3A34&characteristicName=Chloride"
+        "&mimeType=csv"
+    )
+    organization_url = (
+        "https://www.waterqualitydata.us/data/Organization/Search?statecode=US%3A34&characteristicName=Chloride"
+        "&mimeType=csv"
+    )
+    mock_request(requests_mock, site_url, "data/wqp_sites.txt")
+    mock_request(requests_mock, organization_url, "data/wqp_organizations.txt")
+    bundle = get_bundle(
+        services=["Station", "Organization"],
+        statecode="US:34",
+        characteristicName="Chloride",
+    )
+    assert list(bundle) == ["Station", "Organization"]
+    df, md = bundle["Organization"]
+    assert df.size == 576
+    assert md.url == organization_url
+    assert bundle["Station"][1].url == site_url
+    with pytest.raises(TypeError, match="Service Foo not recognized. Valid options"):
+        get_bundle(services=["Foo"])
+    with pytest.raises(ValueError, match="dataProfile"):
+        get_bundle(services=["Result", "Station"], dataProfile="narrowResult")
+    with pytest.raises(ValueError, match="categorical"):
+        get_bundle(services=["Station"], categorical=True)
+
+
 def mock_request(requests_mock, request_url, file_path):
     with open(file_path) as text:
         requests_mock.get(
@@ -216,3 +470,5 @@ def test_check_kwargs():
     kwargs = {"mimeType": "foo"}
     with pytest.raises(ValueError):
         kwargs = _check_kwargs(kwargs)
+    assert _check_kwargs({})["mimeType"] == "csv"
+    assert _check_kwargs({"mimeType": None})["mimeType"] == "csv"